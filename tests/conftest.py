@@ -1,12 +1,21 @@
 """Shared test fixtures."""
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from typer.testing import CliRunner
 
+from mcpax.cli.app import app
 from mcpax.core.api import ModrinthClient
-from mcpax.core.models import ProjectVersion, ReleaseChannel
+from mcpax.core.models import (
+    ModrinthProject,
+    ProjectType,
+    ProjectVersion,
+    ReleaseChannel,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -38,6 +47,125 @@ def sample_projects(fixtures_dir: Path) -> Path:
     return fixtures_dir / "projects.toml"
 
 
+@pytest.fixture
+def prepared_config_dir(tmp_path: Path) -> Path:
+    """Return an empty mcpax config directory under tmp_path.
+
+    Pair with XDG_CONFIG_HOME pointing at tmp_path so the CLI resolves
+    its config files inside this directory.
+    """
+    config_dir = tmp_path / "mcpax"
+    config_dir.mkdir()
+    return config_dir
+
+
+@pytest.fixture(scope="session")
+def _init_template(tmp_path_factory: pytest.TempPathFactory) -> dict[str, bytes]:
+    """Run `mcpax init -y` once per session and return the generated files.
+
+    The output only depends on the built-in defaults, so tests write these
+    bytes out instead of dispatching the init command themselves.
+    """
+    base = tmp_path_factory.mktemp("init_template")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CONFIG_HOME", str(base))
+        result = CliRunner().invoke(app, ["init", "-y"])
+    assert result.exit_code == 0, result.stdout
+    return {path.name: path.read_bytes() for path in (base / "mcpax").iterdir()}
+
+
+@pytest.fixture
+def initialized_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _init_template: dict[str, bytes]
+) -> Path:
+    """Return an initialized mcpax config directory under tmp_path.
+
+    Writes the session template files and points XDG_CONFIG_HOME at tmp_path,
+    which is equivalent to running `mcpax init -y` in the test.
+    """
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    config_dir = tmp_path / "mcpax"
+    config_dir.mkdir()
+    for name, content in _init_template.items():
+        (config_dir / name).write_bytes(content)
+    return config_dir
+
+
+@pytest.fixture(scope="module")
+def sodium_project(request: pytest.FixtureRequest) -> ModrinthProject:
+    """Return the Sodium project returned by the mocked Modrinth API.
+
+    The icon URL defaults to None; tests that need one can set it with
+    indirect parametrization. Module-scoped since ModrinthProject is not
+    frozen, so tests must not mutate it.
+    """
+    return ModrinthProject(
+        id="AANobbMI",
+        slug="sodium",
+        title="Sodium",
+        description="Modern rendering engine",
+        project_type=ProjectType.MOD,
+        downloads=50000000,
+        icon_url=getattr(request, "param", None),
+        versions=["v1"],
+    )
+
+
+@pytest.fixture(scope="module")
+def lithium_project() -> ModrinthProject:
+    """Return the Lithium project returned by the mocked Modrinth API."""
+    return ModrinthProject(
+        id="gvQqBUqZ",
+        slug="lithium",
+        title="Lithium",
+        description="Performance mod",
+        project_type=ProjectType.MOD,
+        downloads=30000000,
+        icon_url=None,
+        versions=["v1"],
+    )
+
+
+@pytest.fixture(scope="module")
+def shader_project() -> ModrinthProject:
+    """Return the Complementary Unbound shader returned by the mocked Modrinth API."""
+    return ModrinthProject(
+        id="HVnmMxH1",
+        slug="complementary-unbound",
+        title="Complementary Unbound",
+        description="Shader pack",
+        project_type=ProjectType.SHADER,
+        downloads=10000000,
+        icon_url=None,
+        versions=["v1"],
+    )
+
+
+@pytest.fixture
+def mock_modrinth(sodium_project: ModrinthProject) -> Iterator[MagicMock]:
+    """Patch the CLI's ModrinthClient and yield the mocked client instance.
+
+    get_project returns sodium_project by default and search is an AsyncMock
+    with no result; set return_value or side_effect on them as needed.
+    """
+    with patch("mcpax.cli.app.ModrinthClient") as mock_client:
+        instance = mock_client.return_value.__aenter__.return_value
+        instance.get_project = AsyncMock(return_value=sodium_project)
+        instance.search = AsyncMock()
+        yield instance
+
+
+@pytest.fixture
+def mock_manager() -> Iterator[MagicMock]:
+    """Patch the CLI's ProjectManager and yield the mocked manager instance.
+
+    Configure the manager methods a test needs, e.g. check_updates, with
+    AsyncMock before invoking the command.
+    """
+    with patch("mcpax.cli.app.ProjectManager") as mock_manager_cls:
+        yield mock_manager_cls.return_value.__aenter__.return_value
+
+
 @pytest.fixture
 def fast_api_client() -> ModrinthClient:
     """Return a ModrinthClient with zero backoff for fast testing.
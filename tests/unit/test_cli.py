@@ -2,292 +2,448 @@
 
 import asyncio
 import json
+import tomllib
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import typer
+from rich.console import Console
 from typer.testing import CliRunner
 
 from mcpax import __version__
-from mcpax.cli.app import app
+from mcpax.cli.app import add, app, list_projects, version_callback
+from mcpax.core.config import save_projects
 from mcpax.core.exceptions import APIError, ProjectNotFoundError
 from mcpax.core.models import (
     InstalledFile,
+    InstallStatus,
     ModrinthProject,
+    ProjectConfig,
+    ProjectFile,
     ProjectType,
     SearchHit,
     SearchResult,
+    UpdateCheckResult,
+    UpdateResult,
 )
 
 runner = CliRunner()
+_ROOT_COMMAND = typer.main.get_command(app)
+
+
+def _read_projects(config_dir: "Path") -> bytes:
+    """Return the raw contents of projects.toml in the given config directory."""
+    return (config_dir / "projects.toml").read_bytes()
+
+
+def _save_projects(config_dir: "Path", *projects: ModrinthProject) -> None:
+    """Write projects.toml as if each project had been added with `mcpax add`."""
+    save_projects(
+        [ProjectConfig(slug=p.slug, project_type=p.project_type) for p in projects],
+        config_dir / "projects.toml",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _xdg_config_home(tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch") -> None:
+    """Point XDG_CONFIG_HOME at tmp_path so the CLI never touches real config."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def _plain_cli_console(monkeypatch: "pytest.MonkeyPatch") -> None:
+    """Give each test a fresh, colourless CLI console.
+
+    The CLI console is created at import time and keeps the width it saw then
+    (pytest-xdist workers export COLUMNS=80), so replace it once the
+    fixed_terminal_width fixture has set COLUMNS. Output is captured as plain
+    text, so skip colour and repr highlighting.
+    """
+    monkeypatch.setattr(
+        "mcpax.cli.app.console", Console(no_color=True, highlight=False)
+    )
+
+
+@pytest.fixture
+def with_sodium(initialized_config: "Path", sodium_project: ModrinthProject) -> "Path":
+    """Return an initialized config directory with sodium already added."""
+    _save_projects(initialized_config, sodium_project)
+    return initialized_config
+
+
+@pytest.fixture
+def mock_load_projects() -> Iterator[MagicMock]:
+    """Patch the config loaders used by update and yield the load_projects mock.
+
+    config.toml is reported as present with a Fabric 1.21.4 config; set
+    return_value on the yielded mock to choose the managed projects.
+    """
+    config_path = MagicMock()
+    config_path.exists.return_value = True
+    config = {
+        "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
+        "paths": {"minecraft_dir": "~/.minecraft"},
+    }
+    with (
+        patch("mcpax.cli.app.get_default_config_path", return_value=config_path),
+        patch("mcpax.cli.app.load_config", return_value=config),
+        patch("mcpax.cli.app.load_projects") as mock_load_projects,
+    ):
+        yield mock_load_projects
+
+
+@pytest.fixture(scope="module")
+def sodium_installed() -> UpdateCheckResult:
+    """Return an update check result for an up-to-date sodium install."""
+    return UpdateCheckResult(
+        slug="sodium",
+        project_type=ProjectType.MOD,
+        status=InstallStatus.INSTALLED,
+        current_version="0.5.0",
+        current_file=None,
+        latest_version="0.5.0",
+        latest_version_id="v0.5.0",
+        latest_file=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def sodium_outdated() -> UpdateCheckResult:
+    """Return an update check result for sodium 0.5.0 with 0.6.0 available."""
+    return UpdateCheckResult(
+        slug="sodium",
+        project_type=ProjectType.MOD,
+        status=InstallStatus.OUTDATED,
+        current_version="0.5.0",
+        current_file=InstalledFile(
+            slug="sodium",
+            project_type=ProjectType.MOD,
+            filename="sodium-0.5.0.jar",
+            version_id="old-version-id",
+            version_number="0.5.0",
+            sha512="abc123",
+            installed_at=datetime(2024, 1, 1, tzinfo=UTC),
+            file_path=Path("~/.minecraft/mods/sodium-0.5.0.jar"),
+        ),
+        latest_version="0.6.0",
+        latest_version_id="version123",
+        latest_file=ProjectFile(
+            url="https://example.com/sodium-0.6.0.jar",
+            filename="sodium-0.6.0.jar",
+            hashes={"sha512": "def456"},
+            size=1024,
+            primary=True,
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def fabric_api_installed() -> UpdateCheckResult:
+    """Return an update check result for an up-to-date fabric-api install."""
+    return UpdateCheckResult(
+        slug="fabric-api",
+        project_type=ProjectType.MOD,
+        status=InstallStatus.INSTALLED,
+        current_version="0.92.0",
+        current_file=InstalledFile(
+            slug="fabric-api",
+            project_type=ProjectType.MOD,
+            filename="fabric-api-0.92.0.jar",
+            version_id="version123",
+            version_number="0.92.0",
+            sha512="abc123",
+            installed_at=datetime(2024, 1, 1, tzinfo=UTC),
+            file_path=Path("~/.minecraft/mods/fabric-api-0.92.0.jar"),
+        ),
+        latest_version="0.92.0",
+        latest_version_id="version123",
+        latest_file=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def sodium_not_installed() -> UpdateCheckResult:
+    """Return an update check result for sodium 0.5.0 not yet installed."""
+    return UpdateCheckResult(
+        slug="sodium",
+        project_type=ProjectType.MOD,
+        status=InstallStatus.NOT_INSTALLED,
+        current_version=None,
+        current_file=None,
+        latest_version="0.5.0",
+        latest_version_id="v0.5.0",
+        latest_file=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def lithium_not_installed() -> UpdateCheckResult:
+    """Return an update check result for lithium 0.11.0 not yet installed."""
+    return UpdateCheckResult(
+        slug="lithium",
+        project_type=ProjectType.MOD,
+        status=InstallStatus.NOT_INSTALLED,
+        current_version=None,
+        current_file=None,
+        latest_version="0.11.0",
+        latest_version_id="v0.11.0",
+        latest_file=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def shader_installed() -> UpdateCheckResult:
+    """Return an update check result for an up-to-date shader install."""
+    return UpdateCheckResult(
+        slug="complementary-unbound",
+        project_type=ProjectType.SHADER,
+        status=InstallStatus.INSTALLED,
+        current_version="r5.2",
+        current_file=None,
+        latest_version="r5.2",
+        latest_version_id="v5.2",
+        latest_file=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def some_mod_incompatible() -> UpdateCheckResult:
+    """Return an update check result for a project with no compatible version."""
+    return UpdateCheckResult(
+        slug="some-mod",
+        project_type=ProjectType.MOD,
+        status=InstallStatus.NOT_COMPATIBLE,
+        current_version=None,
+        current_file=None,
+        latest_version=None,
+        latest_version_id=None,
+        latest_file=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def readonly_config_home(tmp_path_factory: "pytest.TempPathFactory") -> Path:
+    """Return a config home whose config.toml is shared by read-only tests.
+
+    config get and config list never write, so the file is created once per
+    module.
+    """
+    home = tmp_path_factory.mktemp("readonly_config")
+    (home / "mcpax").mkdir()
+    (home / "mcpax" / "config.toml").write_text(
+        """
+[minecraft]
+version = "1.21.4"
+mod_loader = "fabric"
+
+[paths]
+minecraft_dir = "~/.minecraft"
+
+[download]
+max_concurrent = 10
+verify_hash = false
+"""
+    )
+    return home
+
+
+@pytest.fixture(scope="module")
+def search_result() -> SearchResult:
+    """Return a search result with the sodium and lithium hits."""
+    return SearchResult(
+        hits=[
+            SearchHit(
+                slug="sodium",
+                title="Sodium",
+                description="Modern rendering engine",
+                project_type=ProjectType.MOD,
+                downloads=50000000,
+                icon_url=None,
+            ),
+            SearchHit(
+                slug="lithium",
+                title="Lithium",
+                description="Performance mod",
+                project_type=ProjectType.MOD,
+                downloads=30000000,
+                icon_url=None,
+            ),
+        ],
+        total_hits=2,
+        offset=0,
+        limit=10,
+    )
 
 
 class TestVersion:
     """Tests for --version option."""
 
-    def test_version_short_flag(self) -> None:
-        """Test that -V shows version."""
-        # Arrange & Act
-        result = runner.invoke(app, ["-V"])
+    EXPECTED = f"mcpax {__version__}"
+
+    def test_version_callback_prints_version(
+        self, capsys: "pytest.CaptureFixture[str]"
+    ) -> None:
+        """Test that the version callback prints the version and exits."""
+        # Act
+        with pytest.raises(typer.Exit):
+            version_callback(True)
 
         # Assert
-        assert result.exit_code == 0
-        assert f"mcpax {__version__}" in result.stdout
+        assert self.EXPECTED in capsys.readouterr().out
 
-    def test_version_long_flag(self) -> None:
-        """Test that --version shows version."""
-        # Arrange & Act
-        result = runner.invoke(app, ["--version"])
+    def test_version_callback_noop_when_not_requested(
+        self, capsys: "pytest.CaptureFixture[str]"
+    ) -> None:
+        """Test that the version callback does nothing without the flag."""
+        # Act
+        version_callback(False)
+
+        # Assert
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize("flag", ["-V", "--version"], ids=["short", "long"])
+    def test_version_flag(self, flag: str) -> None:
+        """Test that -V and --version show the version."""
+        # Act
+        result = runner.invoke(app, [flag])
 
         # Assert
         assert result.exit_code == 0
-        assert f"mcpax {__version__}" in result.stdout
+        assert self.EXPECTED in result.stdout
 
 
 class TestHelp:
     """Tests for help display."""
 
+    EXPECTED = "Minecraft MOD/Shader/Resource Pack manager"
+
     def test_no_args_shows_help(self) -> None:
         """Test that running without args shows help (with exit code 2)."""
-        # Arrange & Act
+        # Act
         result = runner.invoke(app, [])
 
         # Assert
         # no_args_is_help=True causes exit code 2 (as per Click/Typer behavior)
         assert result.exit_code == 2
-        assert "Minecraft MOD/Shader/Resource Pack manager" in result.stdout
+        assert self.EXPECTED in result.stdout
 
-    def test_help_flag(self) -> None:
-        """Test that --help shows help."""
-        # Arrange & Act
-        result = runner.invoke(app, ["--help"])
+    def test_help_text(self, capsys: "pytest.CaptureFixture[str]") -> None:
+        """Test that help shows the app description."""
+        # Act - Typer's rich formatter prints the help instead of returning it
+        typer.Context(_ROOT_COMMAND).get_help()
 
         # Assert
-        assert result.exit_code == 0
-        assert "Minecraft MOD/Shader/Resource Pack manager" in result.stdout
+        assert self.EXPECTED in capsys.readouterr().out
 
 
 class TestInitCommand:
     """Tests for init command."""
 
-    def test_init_non_interactive_creates_config_file(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init -y creates config.toml."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-        # Act
-        result = runner.invoke(app, ["init", "-y"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert (tmp_path / "mcpax" / "config.toml").exists()
-
-    def test_init_non_interactive_creates_projects_file(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init -y creates projects.toml."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-        # Act
-        result = runner.invoke(app, ["init", "-y"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert (tmp_path / "mcpax" / "projects.toml").exists()
-
-    def test_init_non_interactive_uses_default_values(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init -y uses default values in config.toml."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-        # Act
-        result = runner.invoke(app, ["init", "-y"])
-
-        # Assert
-        assert result.exit_code == 0
-        config_content = (tmp_path / "mcpax" / "config.toml").read_text()
-        assert "1.21.4" in config_content
-        assert "fabric" in config_content
-        assert "~/.minecraft" in config_content
-
-    def test_init_short_flag_y(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init with short flag -y works."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
+    def test_init_non_interactive(self, tmp_path: "Path") -> None:
+        """Test that init -y creates both files with defaults and reports success."""
         # Act
-        result = runner.invoke(app, ["init", "-y"])
+        result = runner.invoke(app, ["init", "-y"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
         assert (tmp_path / "mcpax" / "config.toml").exists()
         assert (tmp_path / "mcpax" / "projects.toml").exists()
+        config = tomllib.loads((tmp_path / "mcpax" / "config.toml").read_text())
+        assert config["minecraft"]["version"] == "1.21.4"
+        assert config["minecraft"]["mod_loader"] == "fabric"
+        assert config["paths"]["minecraft_dir"] == "~/.minecraft"
+        assert "Created" in result.stdout
+        assert "config.toml" in result.stdout
+        assert "projects.toml" in result.stdout
+        assert "Initialization complete!" in result.stdout
+        assert "Configuration stored in:" in result.stdout
+        assert "mcpax add" in result.stdout
 
-    def test_init_fails_when_config_exists(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init fails when config.toml already exists."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_dir = tmp_path / "mcpax"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "config.toml").write_text("")
-
-        # Act
-        result = runner.invoke(app, ["init", "-y"])
-
-        # Assert
-        assert result.exit_code == 1
-        assert "config.toml already exists" in result.stdout
-        assert "Use --force to overwrite" in result.stdout
-
-    def test_init_fails_when_projects_exists(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+    @pytest.mark.parametrize("existing", ["config.toml", "projects.toml"])
+    def test_init_fails_when_file_exists(
+        self, prepared_config_dir: "Path", existing: str
     ) -> None:
-        """Test that init fails when projects.toml already exists."""
+        """Test that init fails when config.toml or projects.toml already exists."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_dir = tmp_path / "mcpax"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "projects.toml").write_text("")
+        (prepared_config_dir / existing).write_text("")
 
         # Act
         result = runner.invoke(app, ["init", "-y"])
 
         # Assert
         assert result.exit_code == 1
-        assert "projects.toml already exists" in result.stdout
+        assert f"{existing} already exists" in result.stdout
         assert "Use --force to overwrite" in result.stdout
 
+    @pytest.mark.parametrize("force_flag", ["--force", "-f"])
     def test_init_force_overwrites_config(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init --force overwrites existing files."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_dir = tmp_path / "mcpax"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "config.toml").write_text("old content")
-        (config_dir / "projects.toml").write_text("old content")
-
-        # Act
-        result = runner.invoke(app, ["init", "-y", "--force"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "old content" not in (config_dir / "config.toml").read_text()
-        assert "old content" not in (config_dir / "projects.toml").read_text()
-
-    def test_init_force_short_flag_f(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init -f short flag works."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_dir = tmp_path / "mcpax"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "config.toml").write_text("old")
-
-        # Act
-        result = runner.invoke(app, ["init", "-y", "-f"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert (config_dir / "config.toml").exists()
-
-    def test_init_interactive_prompts_for_values(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init prompts for values in interactive mode."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-        # Act
-        result = runner.invoke(
-            app, ["init"], input="1.20.1\nforge\noptifine\n/custom/minecraft\n"
-        )
-
-        # Assert
-        assert result.exit_code == 0
-        config_content = (tmp_path / "mcpax" / "config.toml").read_text()
-        assert "1.20.1" in config_content
-        assert "forge" in config_content
-        assert "optifine" in config_content
-        assert "/custom/minecraft" in config_content
-
-    def test_init_interactive_uses_defaults_on_empty_input(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self, prepared_config_dir: "Path", force_flag: str
     ) -> None:
-        """Test that init uses defaults when user presses enter."""
+        """Test that init --force / -f overwrites existing files."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        (prepared_config_dir / "config.toml").write_text("old content")
+        (prepared_config_dir / "projects.toml").write_text("old content")
 
         # Act
-        result = runner.invoke(app, ["init"], input="\n\n\n\n")
+        result = runner.invoke(app, ["init", "-y", force_flag], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        config_content = (tmp_path / "mcpax" / "config.toml").read_text()
-        assert "1.21.4" in config_content
-        assert "fabric" in config_content
-        assert "~/.minecraft" in config_content
-
-    def test_init_shows_success_message(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that init shows success message."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
+        assert "old content" not in (prepared_config_dir / "config.toml").read_text()
+        assert b"old content" not in _read_projects(prepared_config_dir)
+
+    @pytest.mark.parametrize(
+        ("inputs", "expected_minecraft", "expected_minecraft_dir"),
+        [
+            (
+                "1.20.1\nforge\noptifine\n/custom/minecraft\n",
+                {
+                    "version": "1.20.1",
+                    "mod_loader": "forge",
+                    "shader_loader": "optifine",
+                },
+                "/custom/minecraft",
+            ),
+            (
+                "\n\n\n\n",
+                {"version": "1.21.4", "mod_loader": "fabric", "shader_loader": "iris"},
+                "~/.minecraft",
+            ),
+        ],
+        ids=["custom_values", "defaults_on_empty_input"],
+    )
+    def test_init_interactive(
+        self,
+        tmp_path: "Path",
+        inputs: str,
+        expected_minecraft: dict[str, str],
+        expected_minecraft_dir: str,
+    ) -> None:
+        """Test that init prompts for values and falls back to defaults."""
         # Act
-        result = runner.invoke(app, ["init", "-y"])
+        result = runner.invoke(app, ["init"], input=inputs, catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        assert "Created" in result.stdout
-        assert "config.toml" in result.stdout
-        assert "projects.toml" in result.stdout
-        assert "Initialization complete!" in result.stdout
-        assert "Configuration stored in:" in result.stdout
-        assert "mcpax add" in result.stdout
+        config = tomllib.loads((tmp_path / "mcpax" / "config.toml").read_text())
+        assert config["minecraft"] == expected_minecraft
+        assert config["paths"]["minecraft_dir"] == expected_minecraft_dir
 
 
+@pytest.mark.usefixtures("mock_modrinth")
 class TestAddCommand:
     """Tests for add command."""
 
-    def test_add_project_success(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
+    @pytest.mark.parametrize(
+        "sodium_project", ["https://cdn.modrinth.com/..."], indirect=True
+    )
+    def test_add_project_success(self, initialized_config: "Path") -> None:
         """Test that add command successfully adds a project."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine for Minecraft",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url="https://cdn.modrinth.com/...",
-            versions=["v1", "v2"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-
-            # Act
-            result = runner.invoke(app, ["add", "sodium"])
+        # Act
+        result = runner.invoke(app, ["add", "sodium"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
@@ -295,718 +451,308 @@ class TestAddCommand:
         assert "mod" in result.stdout
 
     def test_add_project_saves_to_projects_toml(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self, initialized_config: "Path"
     ) -> None:
         """Test that add command saves project to projects.toml."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-
-            # Act
-            runner.invoke(app, ["add", "sodium"])
-
-        # Assert
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        assert projects_file.exists()
-        content = projects_file.read_text()
-        assert "sodium" in content
-
-    def test_add_project_with_version_option(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that add command with --version option works."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-
-            # Act
-            runner.invoke(app, ["add", "sodium", "--version", "0.5.0"])
-
-        # Assert
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        content = projects_file.read_text()
-        assert "sodium" in content
-        assert "0.5.0" in content
-
-    def test_add_project_with_channel_option(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that add command with --channel option works."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
+        # Act
+        add("sodium")
+
+        # Assert
+        content = _read_projects(initialized_config)
+        assert b"sodium" in content
+
+    @pytest.mark.parametrize(
+        ("extra_args", "expected"),
+        [
+            (["--version", "0.5.0"], b'version = "0.5.0"'),
+            (["-v", "0.5.0"], b'version = "0.5.0"'),
+            (["--channel", "beta"], b'channel = "beta"'),
+            (["-c", "beta"], b'channel = "beta"'),
+        ],
+        ids=["version", "version_short", "channel", "channel_short"],
+    )
+    def test_add_project_with_option(
+        self, initialized_config: "Path", extra_args: list[str], expected: bytes
+    ) -> None:
+        """Test that add command stores --version/--channel in projects.toml."""
+        # Act
+        result = runner.invoke(
+            app, ["add", "sodium", *extra_args], catch_exceptions=False
         )
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-
-            # Act
-            runner.invoke(app, ["add", "sodium", "--channel", "beta"])
-
         # Assert
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        content = projects_file.read_text()
-        assert "sodium" in content
-        assert "beta" in content
+        assert result.exit_code == 0
+        content = _read_projects(initialized_config)
+        assert b"sodium" in content
+        assert expected in content
 
     def test_add_project_not_found(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self, initialized_config: "Path", mock_modrinth: "MagicMock"
     ) -> None:
         """Test that add command shows error when project not found."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(
-                side_effect=ProjectNotFoundError("nonexistent")
-            )
+        mock_modrinth.get_project.side_effect = ProjectNotFoundError("nonexistent")
 
-            # Act
-            result = runner.invoke(app, ["add", "nonexistent"])
+        # Act
+        result = runner.invoke(app, ["add", "nonexistent"])
 
         # Assert
         assert result.exit_code == 1
         assert "not found" in result.stdout.lower()
         assert "nonexistent" in result.stdout
 
-    def test_add_project_already_exists(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
+    def test_add_project_already_exists(self, with_sodium: "Path") -> None:
         """Test that add command shows error when project already exists."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-
-            # Add first time
-            runner.invoke(app, ["add", "sodium"])
-
-            # Act - try to add again
-            result = runner.invoke(app, ["add", "sodium"])
+        # Act - try to add again
+        result = runner.invoke(app, ["add", "sodium"])
 
         # Assert
         assert result.exit_code == 1
         assert "already" in result.stdout.lower()
         assert "sodium" in result.stdout
 
-    def test_add_project_no_config(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that add command shows error when config.toml not found."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-        # Act - try to add without running init
-        result = runner.invoke(app, ["add", "sodium"])
-
-        # Assert
-        assert result.exit_code == 1
-        assert "config.toml not found" in result.stdout or "mcpax init" in result.stdout
-
 
 class TestRemoveCommand:
     """Tests for remove command."""
 
-    def test_remove_project_not_found(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
+    def test_remove_project_not_found(self, initialized_config: "Path") -> None:
         """Test that remove command shows error when project not in list."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
         # Act
-        result = runner.invoke(app, ["remove", "nonexistent"], input="y\n")
+        result = runner.invoke(app, ["remove", "nonexistent"])
 
         # Assert
         assert result.exit_code == 1
         assert "not found" in result.stdout.lower() or "nonexistent" in result.stdout
 
-    def test_remove_project_success(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that remove command successfully removes a project."""
+    def test_remove_project_success(self, with_sodium: "Path") -> None:
+        """Test that remove command removes a project after confirmation."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Act
-        result = runner.invoke(app, ["remove", "sodium"], input="y\n")
+        with patch(
+            "mcpax.cli.app._remove_installed_file_with_manager"
+        ) as mock_remove_file:
+            # Act
+            result = runner.invoke(
+                app, ["remove", "sodium"], input="y\n", catch_exceptions=False
+            )
 
         # Assert
         assert result.exit_code == 0
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        content = projects_file.read_text()
-        assert "sodium" not in content
+        mock_remove_file.assert_not_called()
+        assert b"sodium" not in _read_projects(with_sodium)
 
-    def test_remove_project_confirmation_no(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
+    def test_remove_project_confirmation_no(self, with_sodium: "Path") -> None:
         """Test that remove command does not remove when user says no."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
+        # Act
+        result = runner.invoke(
+            app, ["remove", "sodium"], input="n\n", catch_exceptions=False
         )
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Act - say "no" to confirmation
-        result = runner.invoke(app, ["remove", "sodium"], input="n\n")
-
         # Assert
         assert result.exit_code == 0
         assert "Cancelled" in result.stdout
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        content = projects_file.read_text()
-        assert "sodium" in content  # Should still be in the list
+        assert b"sodium" in _read_projects(with_sodium)  # Should still be listed
 
-    def test_remove_project_skip_confirmation(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
+    def test_remove_project_skip_confirmation(self, with_sodium: "Path") -> None:
         """Test that remove command with --yes skips confirmation."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Act - use --yes to skip confirmation
-        result = runner.invoke(app, ["remove", "sodium", "--yes"])
+        with patch(
+            "mcpax.cli.app._remove_installed_file_with_manager"
+        ) as mock_remove_file:
+            # Act
+            result = runner.invoke(
+                app, ["remove", "sodium", "--yes"], catch_exceptions=False
+            )
 
         # Assert
         assert result.exit_code == 0
+        mock_remove_file.assert_not_called()
         assert "Remove" not in result.stdout  # No confirmation prompt
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        content = projects_file.read_text()
-        assert "sodium" not in content
+        assert b"sodium" not in _read_projects(with_sodium)
 
+    @pytest.mark.parametrize(
+        "args", [["--delete-file", "--yes"], ["-d", "-y"]], ids=["long", "short"]
+    )
     def test_remove_project_with_delete_file(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self, with_sodium: "Path", args: list[str]
     ) -> None:
         """Test that remove command with --delete-file deletes installed file."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock the file deletion helper
         with patch(
-            "mcpax.cli.app._remove_installed_file_with_manager"
+            "mcpax.cli.app._remove_installed_file_with_manager",
+            return_value=(True, "sodium-0.5.0.jar"),
         ) as mock_remove_file:
-            mock_remove_file.return_value = (True, "sodium-0.5.0.jar")
-
             # Act
-            result = runner.invoke(app, ["remove", "sodium", "--delete-file", "--yes"])
+            result = runner.invoke(
+                app, ["remove", "sodium", *args], catch_exceptions=False
+            )
 
         # Assert
         assert result.exit_code == 0
         mock_remove_file.assert_called_once_with("sodium")
         assert "sodium-0.5.0.jar" in result.stdout
+        assert b"sodium" not in _read_projects(with_sodium)
 
     def test_remove_project_delete_file_not_installed(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self, with_sodium: "Path"
     ) -> None:
         """Test that remove command with --delete-file handles not installed case."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock the file deletion helper - returns False (not installed)
-        with patch(
-            "mcpax.cli.app._remove_installed_file_with_manager"
-        ) as mock_remove_file:
-            mock_remove_file.return_value = (False, None)
-
-            # Act
-            result = runner.invoke(app, ["remove", "sodium", "--delete-file", "--yes"])
+        with patch(
+            "mcpax.cli.app._remove_installed_file_with_manager",
+            return_value=(False, None),
+        ) as mock_remove_file:
+            # Act
+            result = runner.invoke(
+                app,
+                ["remove", "sodium", "--delete-file", "--yes"],
+                catch_exceptions=False,
+            )
 
         # Assert
         assert result.exit_code == 0
         mock_remove_file.assert_called_once_with("sodium")
-        # Should still remove from list but indicate no file was installed
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        content = projects_file.read_text()
-        assert "sodium" not in content
+        assert "not installed" in result.stdout
+        assert b"sodium" not in _read_projects(with_sodium)
 
-    def test_remove_project_no_config(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that remove command shows error when config.toml not found."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
 
-        # Act - try to remove without running init
-        result = runner.invoke(app, ["remove", "sodium"], input="y\n")
+class TestNoConfig:
+    """Tests for project commands run before init."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [["add", "sodium"], ["remove", "sodium"], ["install", "sodium"], ["list"]],
+        ids=["add", "remove", "install", "list"],
+    )
+    def test_command_no_config(self, args: list[str]) -> None:
+        """Test that the command shows error when config.toml not found."""
+        # Act - run without init
+        result = runner.invoke(app, args)
 
         # Assert
         assert result.exit_code == 1
         assert "config.toml not found" in result.stdout or "mcpax init" in result.stdout
 
-    def test_remove_project_combined_flags(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that remove command with -d -y flags works correctly."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock the file deletion helper
-        with patch(
-            "mcpax.cli.app._remove_installed_file_with_manager"
-        ) as mock_remove_file:
-            mock_remove_file.return_value = (True, "sodium-0.5.0.jar")
-
-            # Act - use short flags -d -y
-            result = runner.invoke(app, ["remove", "sodium", "-d", "-y"])
-
-        # Assert
-        assert result.exit_code == 0
-        mock_remove_file.assert_called_once_with("sodium")
-        assert "sodium-0.5.0.jar" in result.stdout
-        projects_file = tmp_path / "mcpax" / "projects.toml"
-        content = projects_file.read_text()
-        assert "sodium" not in content
-
 
 class TestInstallCommand:
     """Tests for install command."""
 
     def test_install_single_project_success(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        with_sodium: "Path",
+        mock_manager: "MagicMock",
+        sodium_not_installed: "UpdateCheckResult",
     ) -> None:
         """Test that install command successfully installs a single project."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
+        # Arrange - Mock ProjectManager for install
+        mock_manager.check_updates = AsyncMock(return_value=[sodium_not_installed])
 
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
+        mock_update_result = UpdateResult(
+            successful=["sodium"], failed=[], backed_up=[]
         )
+        mock_manager.apply_updates = AsyncMock(return_value=mock_update_result)
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock ProjectManager for install
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_result = UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.NOT_INSTALLED,
-                current_version=None,
-                current_file=None,
-                latest_version="0.5.0",
-                latest_version_id="v0.5.0",
-                latest_file=None,
-            )
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=[mock_check_result]
-            )
-
-            from mcpax.core.models import UpdateResult
-
-            mock_update_result = UpdateResult(
-                successful=["sodium"], failed=[], backed_up=[]
-            )
-            mock_manager_instance.apply_updates = AsyncMock(
-                return_value=mock_update_result
-            )
-
-            # Act
-            result = runner.invoke(app, ["install", "sodium"])
+        # Act
+        result = runner.invoke(app, ["install", "sodium"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
         assert "sodium" in result.stdout.lower()
 
     def test_install_all_projects_success(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        initialized_config: "Path",
+        sodium_project: "ModrinthProject",
+        lithium_project: "ModrinthProject",
+        mock_manager: "MagicMock",
+        sodium_not_installed: "UpdateCheckResult",
+        lithium_not_installed: "UpdateCheckResult",
     ) -> None:
         """Test that install --all installs all projects."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project_sodium = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_project_lithium = ModrinthProject(
-            id="gvQqBUqZ",
-            slug="lithium",
-            title="Lithium",
-            description="Performance mod",
-            project_type=ProjectType.MOD,
-            downloads=30000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(
-                side_effect=[mock_project_sodium, mock_project_lithium]
-            )
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "lithium"])
+        _save_projects(initialized_config, sodium_project, lithium_project)
 
         # Mock ProjectManager for install
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.NOT_INSTALLED,
-                    current_version=None,
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="lithium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.NOT_INSTALLED,
-                    current_version=None,
-                    current_file=None,
-                    latest_version="0.11.0",
-                    latest_version_id="v0.11.0",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
-
-            from mcpax.core.models import UpdateResult
-
-            mock_update_result = UpdateResult(
-                successful=["sodium", "lithium"], failed=[], backed_up=[]
-            )
-            mock_manager_instance.apply_updates = AsyncMock(
-                return_value=mock_update_result
-            )
-
-            # Act
-            result = runner.invoke(app, ["install", "--all"])
-
-        # Assert
-        assert result.exit_code == 0
-
-    def test_install_no_args_shows_error(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that install without slug or --all shows error."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        # Act
-        result = runner.invoke(app, ["install"])
-
-        # Assert
-        assert result.exit_code != 0
+        mock_check_results = [
+            sodium_not_installed,
+            lithium_not_installed,
+        ]
+        mock_manager.check_updates = AsyncMock(return_value=mock_check_results)
 
-    def test_install_slug_with_all_shows_error(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that install with slug and --all shows error."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
+        mock_update_result = UpdateResult(
+            successful=["sodium", "lithium"], failed=[], backed_up=[]
+        )
+        mock_manager.apply_updates = AsyncMock(return_value=mock_update_result)
 
         # Act
-        result = runner.invoke(app, ["install", "sodium", "--all"])
+        result = runner.invoke(app, ["install", "--all"], catch_exceptions=False)
 
         # Assert
-        assert result.exit_code == 1
-        assert "Cannot use --all" in result.stdout
+        assert result.exit_code == 0
 
-    def test_install_project_not_in_list(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+    @pytest.mark.parametrize(
+        ("args", "message"),
+        [
+            pytest.param(["install"], "Specify a project slug", id="no-target"),
+            pytest.param(
+                ["install", "sodium", "--all"], "Cannot use --all", id="slug-and-all"
+            ),
+            pytest.param(
+                ["install", "nonexistent"],
+                "Project 'nonexistent' not found",
+                id="not-in-list",
+            ),
+        ],
+    )
+    def test_install_invalid_target_shows_error(
+        self, initialized_config: "Path", args: list[str], message: str
     ) -> None:
-        """Test that install shows error when project not in projects.toml."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
+        """Test that install rejects a missing, conflicting or unknown target."""
         # Act
-        result = runner.invoke(app, ["install", "nonexistent"])
+        result = runner.invoke(app, args)
 
         # Assert
         assert result.exit_code == 1
-        assert "not found" in result.stdout.lower() or "nonexistent" in result.stdout
+        assert message in result.stdout
 
     def test_install_no_compatible_version(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self, with_sodium: "Path", mock_manager: "MagicMock"
     ) -> None:
         """Test that install handles no compatible version gracefully."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
+        # Arrange - Mock ProjectManager to return NOT_COMPATIBLE
+        mock_check_result = UpdateCheckResult(
             slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
             project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
+            status=InstallStatus.NOT_COMPATIBLE,
+            current_version=None,
+            current_file=None,
+            latest_version=None,
+            latest_version_id=None,
+            latest_file=None,
         )
+        mock_manager.check_updates = AsyncMock(return_value=[mock_check_result])
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock ProjectManager to return NOT_COMPATIBLE
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_result = UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.NOT_COMPATIBLE,
-                current_version=None,
-                current_file=None,
-                latest_version=None,
-                latest_version_id=None,
-                latest_file=None,
-            )
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=[mock_check_result]
-            )
-
-            # Act
-            result = runner.invoke(app, ["install", "sodium"])
+        # Act
+        result = runner.invoke(app, ["install", "sodium"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0  # Should complete but show warning
         assert "compatible" in result.stdout.lower() or "sodium" in result.stdout
 
     def test_install_already_installed_skips(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        with_sodium: "Path",
+        mock_manager: "MagicMock",
+        sodium_installed: "UpdateCheckResult",
     ) -> None:
         """Test that install skips already installed projects."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock ProjectManager to return INSTALLED
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_result = UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.INSTALLED,
-                current_version="0.5.0",
-                current_file=None,
-                latest_version="0.5.0",
-                latest_version_id="v0.5.0",
-                latest_file=None,
-            )
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=[mock_check_result]
-            )
-
-            from mcpax.core.models import UpdateResult
+        # Arrange - Mock ProjectManager to return INSTALLED
+        mock_manager.check_updates = AsyncMock(return_value=[sodium_installed])
 
-            mock_update_result = UpdateResult(successful=[], failed=[], backed_up=[])
-            mock_manager_instance.apply_updates = AsyncMock(
-                return_value=mock_update_result
-            )
+        mock_update_result = UpdateResult(successful=[], failed=[], backed_up=[])
+        mock_manager.apply_updates = AsyncMock(return_value=mock_update_result)
 
-            # Act
-            result = runner.invoke(app, ["install", "sodium"])
+        # Act
+        result = runner.invoke(app, ["install", "sodium"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
@@ -1015,660 +761,160 @@ class TestInstallCommand:
             "installed" in result.stdout.lower() or "already" in result.stdout.lower()
         )
 
-    def test_install_no_config(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that install shows error when config.toml not found."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-        # Act - try to install without running init
-        result = runner.invoke(app, ["install", "sodium"])
-
-        # Assert
-        assert result.exit_code == 1
-        assert "config.toml not found" in result.stdout or "mcpax init" in result.stdout
-
 
 class TestListCommand:
     """Tests for list command."""
 
-    def test_list_no_config(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list command shows error when config.toml not found."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-        # Act
-        result = runner.invoke(app, ["list"])
-
-        # Assert
-        assert result.exit_code == 1
-        assert "config.toml not found" in result.stdout or "mcpax init" in result.stdout
-
-    def test_list_empty_projects(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
+    def test_list_empty_projects(self, initialized_config: "Path") -> None:
         """Test that list command shows message when no projects configured."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
         # Act
-        result = runner.invoke(app, ["list"])
+        result = runner.invoke(app, ["list"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
         assert "No projects configured" in result.stdout
 
     def test_list_shows_projects(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        with_sodium: "Path",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_installed: "UpdateCheckResult",
     ) -> None:
         """Test that list command shows project list."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_result = UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.INSTALLED,
-                current_version="0.5.0",
-                current_file=None,
-                latest_version="0.5.0",
-                latest_version_id="v0.5.0",
-                latest_file=None,
-            )
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=[mock_check_result]
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(return_value=mock_project)
+        # Arrange - Mock ProjectManager for listing
+        mock_manager.check_updates = AsyncMock(return_value=[sodium_installed])
 
-                # Act
-                result = runner.invoke(app, ["list"])
+        # Act
+        result = runner.invoke(app, ["list"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
         assert "sodium" in result.stdout.lower() or "Sodium" in result.stdout
 
     def test_list_groups_by_type(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        initialized_config: "Path",
+        sodium_project: "ModrinthProject",
+        shader_project: "ModrinthProject",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_installed: "UpdateCheckResult",
+        shader_installed: "UpdateCheckResult",
     ) -> None:
         """Test that list command groups projects by type."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_mod = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_shader = ModrinthProject(
-            id="HVnmMxH1",
-            slug="complementary-unbound",
-            title="Complementary Unbound",
-            description="Shader pack",
-            project_type=ProjectType.SHADER,
-            downloads=10000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(side_effect=[mock_mod, mock_shader])
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "complementary-unbound"])
+        _save_projects(initialized_config, sodium_project, shader_project)
 
         # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="complementary-unbound",
-                    project_type=ProjectType.SHADER,
-                    status=InstallStatus.INSTALLED,
-                    current_version="r5.2",
-                    current_file=None,
-                    latest_version="r5.2",
-                    latest_version_id="v5.2",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
+        mock_check_results = [
+            sodium_installed,
+            shader_installed,
+        ]
+        mock_manager.check_updates = AsyncMock(return_value=mock_check_results)
 
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(
-                    side_effect=[mock_mod, mock_shader]
-                )
+        mock_modrinth.get_project.side_effect = {
+            p.slug: p for p in (sodium_project, shader_project)
+        }.get
 
-                # Act
-                result = runner.invoke(app, ["list"])
+        # Act
+        result = runner.invoke(app, ["list"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
         assert "mod" in result.stdout.lower() or "MOD" in result.stdout
         assert "shader" in result.stdout.lower() or "Shader" in result.stdout
 
-    def test_list_filter_type_mod(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list --type mod filters to show only mods."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_mod = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_shader = ModrinthProject(
-            id="HVnmMxH1",
-            slug="complementary-unbound",
-            title="Complementary Unbound",
-            description="Shader pack",
-            project_type=ProjectType.SHADER,
-            downloads=10000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(side_effect=[mock_mod, mock_shader])
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "complementary-unbound"])
-
-        # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="complementary-unbound",
-                    project_type=ProjectType.SHADER,
-                    status=InstallStatus.INSTALLED,
-                    current_version="r5.2",
-                    current_file=None,
-                    latest_version="r5.2",
-                    latest_version_id="v5.2",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(
-                    side_effect=[mock_mod, mock_shader]
-                )
-
-                # Act
-                result = runner.invoke(app, ["list", "--type", "mod"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "sodium" in result.stdout.lower() or "Sodium" in result.stdout
-        assert (
-            "complementary" not in result.stdout.lower()
-        )  # Shader should not be shown
-
-    def test_list_filter_type_shader(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list --type shader filters to show only shaders."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_mod = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_shader = ModrinthProject(
-            id="HVnmMxH1",
-            slug="complementary-unbound",
-            title="Complementary Unbound",
-            description="Shader pack",
-            project_type=ProjectType.SHADER,
-            downloads=10000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(side_effect=[mock_mod, mock_shader])
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "complementary-unbound"])
-
-        # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="complementary-unbound",
-                    project_type=ProjectType.SHADER,
-                    status=InstallStatus.INSTALLED,
-                    current_version="r5.2",
-                    current_file=None,
-                    latest_version="r5.2",
-                    latest_version_id="v5.2",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(
-                    side_effect=[mock_mod, mock_shader]
-                )
-
-                # Act
-                result = runner.invoke(app, ["list", "--type", "shader"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert (
-            "complementary" in result.stdout.lower() or "Complementary" in result.stdout
-        )
-        assert "sodium" not in result.stdout.lower()  # Mod should not be shown
-
-    def test_list_filter_status_installed(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list --status installed filters to show only installed projects."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_sodium = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_lithium = ModrinthProject(
-            id="gvQqBUqZ",
-            slug="lithium",
-            title="Lithium",
-            description="Performance mod",
-            project_type=ProjectType.MOD,
-            downloads=30000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(
-                side_effect=[mock_sodium, mock_lithium]
-            )
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "lithium"])
-
-        # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="lithium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.NOT_INSTALLED,
-                    current_version=None,
-                    current_file=None,
-                    latest_version="0.11.0",
-                    latest_version_id="v0.11.0",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(
-                    side_effect=[mock_sodium, mock_lithium]
-                )
-
-                # Act
-                result = runner.invoke(app, ["list", "--status", "installed"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "sodium" in result.stdout.lower() or "Sodium" in result.stdout
-        assert (
-            "lithium" not in result.stdout.lower()
-        )  # Not installed should not be shown
-
-    def test_list_filter_status_not_installed(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list --status not-installed filters to show only not installed."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_sodium = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_lithium = ModrinthProject(
-            id="gvQqBUqZ",
-            slug="lithium",
-            title="Lithium",
-            description="Performance mod",
-            project_type=ProjectType.MOD,
-            downloads=30000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(
-                side_effect=[mock_sodium, mock_lithium]
-            )
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "lithium"])
-
-        # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="lithium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.NOT_INSTALLED,
-                    current_version=None,
-                    current_file=None,
-                    latest_version="0.11.0",
-                    latest_version_id="v0.11.0",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(
-                    side_effect=[mock_sodium, mock_lithium]
-                )
-
-                # Act
-                result = runner.invoke(app, ["list", "--status", "not-installed"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "lithium" in result.stdout.lower() or "Lithium" in result.stdout
-        assert "sodium" not in result.stdout.lower()  # Installed should not be shown
-
-    def test_list_filter_status_outdated(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list --status outdated filters to show only outdated projects."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_sodium = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_lithium = ModrinthProject(
-            id="gvQqBUqZ",
-            slug="lithium",
-            title="Lithium",
-            description="Performance mod",
-            project_type=ProjectType.MOD,
-            downloads=30000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(
-                side_effect=[mock_sodium, mock_lithium]
-            )
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "lithium"])
-
-        # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="lithium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.OUTDATED,
-                    current_version="0.10.0",
-                    current_file=None,
-                    latest_version="0.11.0",
-                    latest_version_id="v0.11.0",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(
-                    side_effect=[mock_sodium, mock_lithium]
-                )
+    @pytest.mark.parametrize(
+        ("args", "shown", "hidden"),
+        [
+            pytest.param(["--type", "mod"], "sodium", ["complementary"], id="mod"),
+            pytest.param(
+                ["--type", "shader"], "complementary", ["sodium"], id="shader"
+            ),
+            pytest.param(
+                ["--status", "installed"],
+                "sodium",
+                ["lithium", "complementary"],
+                id="installed",
+            ),
+            pytest.param(
+                ["--status", "not-installed"],
+                "lithium",
+                ["sodium", "complementary"],
+                id="not-installed",
+            ),
+            pytest.param(
+                ["--status", "outdated"],
+                "complementary",
+                ["sodium", "lithium"],
+                id="outdated",
+            ),
+        ],
+    )
+    def test_list_filter(
+        self,
+        initialized_config: "Path",
+        sodium_project: "ModrinthProject",
+        lithium_project: "ModrinthProject",
+        shader_project: "ModrinthProject",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_installed: "UpdateCheckResult",
+        lithium_not_installed: "UpdateCheckResult",
+        args: list[str],
+        shown: str,
+        hidden: list[str],
+    ) -> None:
+        """Test that list --type and --status show only matching projects."""
+        # Arrange - one installed mod, one missing mod and one outdated shader
+        projects = [sodium_project, lithium_project, shader_project]
+        _save_projects(initialized_config, *projects)
+
+        mock_check_results = [
+            sodium_installed,
+            lithium_not_installed,
+            UpdateCheckResult(
+                slug="complementary-unbound",
+                project_type=ProjectType.SHADER,
+                status=InstallStatus.OUTDATED,
+                current_version="r5.1",
+                current_file=None,
+                latest_version="r5.2",
+                latest_version_id="v5.2",
+                latest_file=None,
+            ),
+        ]
+        mock_manager.check_updates = AsyncMock(return_value=mock_check_results)
+        mock_modrinth.get_project.side_effect = {p.slug: p for p in projects}.get
 
-                # Act
-                result = runner.invoke(app, ["list", "--status", "outdated"])
+        # Act
+        result = runner.invoke(app, ["list", *args], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        assert "lithium" in result.stdout.lower() or "Lithium" in result.stdout
-        assert "sodium" not in result.stdout.lower()  # Up-to-date should not be shown
+        output = result.stdout.lower()
+        assert shown in output
+        for slug in hidden:
+            assert slug not in output
 
     def test_list_json_output(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        with_sodium: "Path",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_installed: "UpdateCheckResult",
     ) -> None:
         """Test that list --json outputs JSON format."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
+        # Arrange - Mock ProjectManager for listing
+        mock_manager.check_updates = AsyncMock(return_value=[sodium_installed])
 
-            mock_check_result = UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.INSTALLED,
-                current_version="0.5.0",
-                current_file=None,
-                latest_version="0.5.0",
-                latest_version_id="v0.5.0",
-                latest_file=None,
-            )
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=[mock_check_result]
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(return_value=mock_project)
-
-                # Act
-                result = runner.invoke(app, ["list", "--json"])
+        # Act
+        result = runner.invoke(app, ["list", "--json"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
         # Should be valid JSON
-        import json
-
         try:
             json_data = json.loads(result.stdout)
             assert isinstance(json_data, list)
@@ -1677,77 +923,42 @@ class TestListCommand:
         except json.JSONDecodeError:
             pytest.fail(f"Output is not valid JSON: {result.stdout}")
 
-    def test_list_invalid_type_filter(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list --type with invalid value shows error."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        # Act
-        result = runner.invoke(app, ["list", "--type", "invalid"])
-
-        # Assert
-        assert result.exit_code == 1
-        assert "invalid" in result.stdout.lower() or "type" in result.stdout.lower()
-
-    def test_list_invalid_status_filter(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list --status with invalid value shows error."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        # Act
-        result = runner.invoke(app, ["list", "--status", "invalid"])
-
-        # Assert
-        assert result.exit_code == 1
-        assert "invalid" in result.stdout.lower() or "status" in result.stdout.lower()
-
-    def test_list_no_update_rejects_outdated_status(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+    @pytest.mark.parametrize(
+        ("args", "message"),
+        [
+            pytest.param(
+                ["--type", "invalid"], "Invalid type 'invalid'", id="invalid-type"
+            ),
+            pytest.param(
+                ["--status", "invalid"], "Invalid status 'invalid'", id="invalid-status"
+            ),
+            pytest.param(
+                ["--no-update", "--status", "outdated"],
+                "not supported with --no-update",
+                id="no-update-outdated",
+            ),
+        ],
+    )
+    def test_list_rejects_invalid_filter(
+        self, initialized_config: "Path", args: list[str], message: str
     ) -> None:
-        """Test that list --no-update rejects outdated status filter."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
+        """Test that list rejects unknown or unsupported filter values."""
         # Act
-        result = runner.invoke(app, ["list", "--no-update", "--status", "outdated"])
+        result = runner.invoke(app, ["list", *args])
 
         # Assert
         assert result.exit_code == 1
-        assert (
-            "no-update" in result.stdout.lower() or "outdated" in result.stdout.lower()
-        )
+        assert message in result.stdout
 
     def test_list_no_update_skips_check_updates(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        with_sodium: "Path",
+        tmp_path: "Path",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
     ) -> None:
         """Test that list --no-update skips update checks."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
         mods_dir = tmp_path / "mods"
         mods_dir.mkdir(parents=True, exist_ok=True)
         file_path = mods_dir / "sodium.jar"
@@ -1760,414 +971,165 @@ class TestListCommand:
             version_id="v0.5.0",
             version_number="0.5.0",
             sha512="abc123",
-            installed_at=datetime.now(UTC),
+            installed_at=datetime(2024, 1, 1, tzinfo=UTC),
             file_path=file_path,
         )
 
         # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            mock_manager_instance.get_installed_file = AsyncMock(return_value=installed)
-            mock_manager_instance.check_updates = AsyncMock()
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(return_value=mock_project)
-
-                # Act
-                result = runner.invoke(app, ["list", "--no-update"])
-
-        # Assert
-        assert result.exit_code == 0
-        mock_manager_instance.check_updates.assert_not_called()
-        assert "sodium" in result.stdout.lower() or "Sodium" in result.stdout
-
-    def test_list_respects_max_concurrency(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
-    ) -> None:
-        """Test that list respects the max concurrency limit."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
+        mock_manager.get_installed_file = AsyncMock(return_value=installed)
+        mock_manager.check_updates = AsyncMock()
 
-        mock_projects = [
-            ModrinthProject(
-                id="AANobbMI",
-                slug="sodium",
-                title="Sodium",
-                description="Modern rendering engine",
-                project_type=ProjectType.MOD,
-                downloads=50000000,
-                icon_url=None,
-                versions=["v1"],
-            ),
-            ModrinthProject(
-                id="gvQqBUqZ",
-                slug="lithium",
-                title="Lithium",
-                description="Performance mod",
-                project_type=ProjectType.MOD,
-                downloads=30000000,
-                icon_url=None,
-                versions=["v1"],
-            ),
-            ModrinthProject(
-                id="HVnmMxH1",
-                slug="complementary-unbound",
-                title="Complementary Unbound",
-                description="Shader pack",
-                project_type=ProjectType.SHADER,
-                downloads=10000000,
-                icon_url=None,
-                versions=["v1"],
-            ),
-        ]
+        # Act
+        result = runner.invoke(app, ["list", "--no-update"], catch_exceptions=False)
+
+        # Assert
+        assert result.exit_code == 0
+        mock_manager.check_updates.assert_not_called()
+        assert "sodium" in result.stdout.lower() or "Sodium" in result.stdout
+
+    def test_list_respects_max_concurrency(
+        self,
+        initialized_config: "Path",
+        sodium_project: "ModrinthProject",
+        lithium_project: "ModrinthProject",
+        shader_project: "ModrinthProject",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_installed: "UpdateCheckResult",
+        shader_installed: "UpdateCheckResult",
+    ) -> None:
+        """Test that list respects the max concurrency limit."""
+        # Arrange
+        mock_projects = [sodium_project, lithium_project, shader_project]
         project_map = {project.slug: project for project in mock_projects}
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(side_effect=mock_projects)
-            for project in mock_projects:
-                runner.invoke(app, ["add", project.slug])
+        _save_projects(initialized_config, *mock_projects)
 
         # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="lithium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.11.0",
-                    current_file=None,
-                    latest_version="0.11.0",
-                    latest_version_id="v0.11.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="complementary-unbound",
-                    project_type=ProjectType.SHADER,
-                    status=InstallStatus.INSTALLED,
-                    current_version="r5.2",
-                    current_file=None,
-                    latest_version="r5.2",
-                    latest_version_id="v5.2",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
+        mock_check_results = [
+            sodium_installed,
+            UpdateCheckResult(
+                slug="lithium",
+                project_type=ProjectType.MOD,
+                status=InstallStatus.INSTALLED,
+                current_version="0.11.0",
+                current_file=None,
+                latest_version="0.11.0",
+                latest_version_id="v0.11.0",
+                latest_file=None,
+            ),
+            shader_installed,
+        ]
+        mock_manager.check_updates = AsyncMock(return_value=mock_check_results)
 
-            current = 0
-            max_seen = 0
+        current = 0
+        max_seen = 0
 
-            async def tracked_get_project(slug: str) -> ModrinthProject:
-                nonlocal current, max_seen
-                current += 1
-                if current > max_seen:
-                    max_seen = current
-                await asyncio.sleep(0.01)
-                current -= 1
-                return project_map[slug]
+        async def tracked_get_project(slug: str) -> ModrinthProject:
+            nonlocal current, max_seen
+            current += 1
+            if current > max_seen:
+                max_seen = current
+            await asyncio.sleep(0)
+            current -= 1
+            return project_map[slug]
 
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(side_effect=tracked_get_project)
+        mock_modrinth.get_project.side_effect = tracked_get_project
 
-                # Act
-                result = runner.invoke(app, ["list", "--max-concurrency", "1"])
+        # Act
+        result = runner.invoke(
+            app, ["list", "--max-concurrency", "1"], catch_exceptions=False
+        )
 
         # Assert
         assert result.exit_code == 0
         assert max_seen == 1
 
     def test_list_shows_status_icons(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        initialized_config: "Path",
+        sodium_project: "ModrinthProject",
+        lithium_project: "ModrinthProject",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_installed: "UpdateCheckResult",
+        lithium_not_installed: "UpdateCheckResult",
+        capsys: "pytest.CaptureFixture[str]",
     ) -> None:
         """Test that list command shows status icons."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_sodium = ModrinthProject(
-            id="AANobbMI",
-            slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
-            project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        mock_lithium = ModrinthProject(
-            id="gvQqBUqZ",
-            slug="lithium",
-            title="Lithium",
-            description="Performance mod",
-            project_type=ProjectType.MOD,
-            downloads=30000000,
-            icon_url=None,
-            versions=["v1"],
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(
-                side_effect=[mock_sodium, mock_lithium]
-            )
-            runner.invoke(app, ["add", "sodium"])
-            runner.invoke(app, ["add", "lithium"])
+        _save_projects(initialized_config, sodium_project, lithium_project)
 
         # Mock ProjectManager for listing
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_results = [
-                UpdateCheckResult(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.INSTALLED,
-                    current_version="0.5.0",
-                    current_file=None,
-                    latest_version="0.5.0",
-                    latest_version_id="v0.5.0",
-                    latest_file=None,
-                ),
-                UpdateCheckResult(
-                    slug="lithium",
-                    project_type=ProjectType.MOD,
-                    status=InstallStatus.NOT_INSTALLED,
-                    current_version=None,
-                    current_file=None,
-                    latest_version="0.11.0",
-                    latest_version_id="v0.11.0",
-                    latest_file=None,
-                ),
-            ]
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=mock_check_results
-            )
+        mock_check_results = [
+            sodium_installed,
+            lithium_not_installed,
+        ]
+        mock_manager.check_updates = AsyncMock(return_value=mock_check_results)
 
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(
-                    side_effect=[mock_sodium, mock_lithium]
-                )
+        mock_modrinth.get_project.side_effect = {
+            p.slug: p for p in (sodium_project, lithium_project)
+        }.get
 
-                # Act
-                result = runner.invoke(app, ["list"])
+        # Act
+        list_projects()
 
         # Assert
-        assert result.exit_code == 0
+        stdout = capsys.readouterr().out
         # Check for status icons (✓ for installed, ○ for not installed)
-        assert "✓" in result.stdout or "○" in result.stdout
+        assert "✓" in stdout or "○" in stdout
 
     def test_list_shows_version_update_arrow(
-        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+        self,
+        with_sodium: "Path",
+        mock_modrinth: "MagicMock",
+        mock_manager: "MagicMock",
+        capsys: "pytest.CaptureFixture[str]",
     ) -> None:
         """Test that list command shows arrow for version updates."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        runner.invoke(app, ["init", "-y"])
-
-        mock_project = ModrinthProject(
-            id="AANobbMI",
+        # Arrange - Mock ProjectManager for listing with outdated status
+        mock_check_result = UpdateCheckResult(
             slug="sodium",
-            title="Sodium",
-            description="Modern rendering engine",
             project_type=ProjectType.MOD,
-            downloads=50000000,
-            icon_url=None,
-            versions=["v1"],
+            status=InstallStatus.OUTDATED,
+            current_version="0.5.0",
+            current_file=None,
+            latest_version="0.6.0",
+            latest_version_id="v0.6.0",
+            latest_file=None,
         )
+        mock_manager.check_updates = AsyncMock(return_value=[mock_check_result])
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.get_project = AsyncMock(return_value=mock_project)
-            runner.invoke(app, ["add", "sodium"])
-
-        # Mock ProjectManager for listing with outdated status
-        with patch("mcpax.cli.app.ProjectManager") as MockManager:
-            mock_manager_instance = MockManager.return_value.__aenter__.return_value
-            from mcpax.core.models import InstallStatus, UpdateCheckResult
-
-            mock_check_result = UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.OUTDATED,
-                current_version="0.5.0",
-                current_file=None,
-                latest_version="0.6.0",
-                latest_version_id="v0.6.0",
-                latest_file=None,
-            )
-            mock_manager_instance.check_updates = AsyncMock(
-                return_value=[mock_check_result]
-            )
-
-            with patch("mcpax.cli.app.ModrinthClient") as MockClient2:
-                mock_instance2 = MockClient2.return_value.__aenter__.return_value
-                mock_instance2.get_project = AsyncMock(return_value=mock_project)
-
-                # Act
-                result = runner.invoke(app, ["list"])
+        # Act
+        list_projects()
 
         # Assert
-        assert result.exit_code == 0
+        stdout = capsys.readouterr().out
         # Check for arrow indicator showing version update
-        assert "→" in result.stdout or "0.5.0" in result.stdout
+        assert "→" in stdout or "0.5.0" in stdout
 
 
 class TestSearchCommand:
     """Tests for search command."""
 
-    def test_search_basic_query(self) -> None:
-        """Test that search command returns results for a basic query."""
-        # Arrange
-        mock_result = SearchResult(
-            hits=[
-                SearchHit(
-                    slug="sodium",
-                    title="Sodium",
-                    description="Modern rendering engine for Minecraft",
-                    project_type=ProjectType.MOD,
-                    downloads=50000000,
-                    icon_url="https://cdn.modrinth.com/...",
-                )
-            ],
-            total_hits=1,
-            offset=0,
-            limit=10,
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
-
-            # Act
-            result = runner.invoke(app, ["search", "sodium"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "sodium" in result.stdout.lower() or "Sodium" in result.stdout
-
-    def test_search_shows_numbered_results(self) -> None:
-        """Test that search command shows numbered results."""
-        # Arrange
-        mock_result = SearchResult(
-            hits=[
-                SearchHit(
-                    slug="sodium",
-                    title="Sodium",
-                    description="Modern rendering engine",
-                    project_type=ProjectType.MOD,
-                    downloads=50000000,
-                    icon_url=None,
-                ),
-                SearchHit(
-                    slug="lithium",
-                    title="Lithium",
-                    description="Performance mod",
-                    project_type=ProjectType.MOD,
-                    downloads=30000000,
-                    icon_url=None,
-                ),
-            ],
-            total_hits=2,
-            offset=0,
-            limit=10,
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
-
-            # Act
-            result = runner.invoke(app, ["search", "performance"])
-
-        # Assert
-        assert result.exit_code == 0
-        # Check for numbered list
-        assert "1." in result.stdout or "1)" in result.stdout
-
-    def test_search_displays_downloads_formatted(self) -> None:
-        """Test that search command formats download numbers with commas."""
-        # Arrange
-        mock_result = SearchResult(
-            hits=[
-                SearchHit(
-                    slug="sodium",
-                    title="Sodium",
-                    description="Modern rendering engine",
-                    project_type=ProjectType.MOD,
-                    downloads=12345678,
-                    icon_url=None,
-                )
-            ],
-            total_hits=1,
-            offset=0,
-            limit=10,
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
-
-            # Act
-            result = runner.invoke(app, ["search", "sodium"])
-
-        # Assert
-        assert result.exit_code == 0
-        # Check for comma-separated downloads
-        assert "12,345,678" in result.stdout
-
-    def test_search_shows_add_hint(self) -> None:
-        """Test that search command shows hint about adding projects."""
+    def test_search_shows_results(
+        self, mock_modrinth: "MagicMock", search_result: "SearchResult"
+    ) -> None:
+        """Test that search lists numbered hits, downloads and an add hint."""
         # Arrange
-        mock_result = SearchResult(
-            hits=[
-                SearchHit(
-                    slug="sodium",
-                    title="Sodium",
-                    description="Modern rendering engine",
-                    project_type=ProjectType.MOD,
-                    downloads=50000000,
-                    icon_url=None,
-                )
-            ],
-            total_hits=1,
-            offset=0,
-            limit=10,
-        )
-
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
+        mock_modrinth.search.return_value = search_result
 
-            # Act
-            result = runner.invoke(app, ["search", "sodium"])
+        # Act
+        result = runner.invoke(app, ["search", "rendering"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        # Check for hint about mcpax add command
+        assert "1. Sodium (mod)" in result.stdout
+        assert "2. Lithium (mod)" in result.stdout
+        assert "Downloads: 50,000,000" in result.stdout
         assert "mcpax add" in result.stdout
 
-    def test_search_limit_option(self) -> None:
+    def test_search_limit_option(self, mock_modrinth: "MagicMock") -> None:
         """Test that search command respects --limit option."""
         # Arrange
         mock_result = SearchResult(
@@ -2187,74 +1149,46 @@ class TestSearchCommand:
             limit=5,
         )
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
+        mock_modrinth.search.return_value = mock_result
 
-            # Act
-            result = runner.invoke(app, ["search", "test", "--limit", "5"])
+        # Act
+        result = runner.invoke(
+            app, ["search", "test", "--limit", "5"], catch_exceptions=False
+        )
 
         # Assert
         assert result.exit_code == 0
-        mock_instance.search.assert_called_once_with("test", limit=5)
+        mock_modrinth.search.assert_called_once_with("test", limit=5)
 
-    def test_search_type_filter_mod(self) -> None:
+    def test_search_type_filter_mod(
+        self, mock_modrinth: "MagicMock", search_result: "SearchResult"
+    ) -> None:
         """Test that search command with --type mod filters to mods."""
         # Arrange
-        mock_result = SearchResult(
-            hits=[
-                SearchHit(
-                    slug="sodium",
-                    title="Sodium",
-                    description="Modern rendering engine",
-                    project_type=ProjectType.MOD,
-                    downloads=50000000,
-                    icon_url=None,
-                ),
-            ],
-            total_hits=2,
-            offset=0,
-            limit=10,
-        )
+        mock_modrinth.search.return_value = search_result
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
-
-            # Act
-            result = runner.invoke(app, ["search", "test", "--type", "mod"])
+        # Act
+        result = runner.invoke(
+            app, ["search", "test", "--type", "mod"], catch_exceptions=False
+        )
 
         # Assert
         assert result.exit_code == 0
         facets = json.dumps([[f"project_type:{ProjectType.MOD.value}"]])
-        mock_instance.search.assert_called_once_with("test", limit=10, facets=facets)
+        mock_modrinth.search.assert_called_once_with("test", limit=10, facets=facets)
         assert "sodium" in result.stdout.lower() or "Sodium" in result.stdout
 
-    def test_search_json_output(self) -> None:
+    def test_search_json_output(
+        self, mock_modrinth: "MagicMock", search_result: "SearchResult"
+    ) -> None:
         """Test that search command with --json outputs JSON format."""
         # Arrange
-        mock_result = SearchResult(
-            hits=[
-                SearchHit(
-                    slug="sodium",
-                    title="Sodium",
-                    description="Modern rendering engine",
-                    project_type=ProjectType.MOD,
-                    downloads=50000000,
-                    icon_url=None,
-                )
-            ],
-            total_hits=1,
-            offset=0,
-            limit=10,
-        )
+        mock_modrinth.search.return_value = search_result
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
-
-            # Act
-            result = runner.invoke(app, ["search", "sodium", "--json"])
+        # Act
+        result = runner.invoke(
+            app, ["search", "sodium", "--json"], catch_exceptions=False
+        )
 
         # Assert
         assert result.exit_code == 0
@@ -2262,14 +1196,14 @@ class TestSearchCommand:
         try:
             json_data = json.loads(result.stdout)
             assert isinstance(json_data, list)
-            assert len(json_data) == 1
+            assert len(json_data) == 2
             assert json_data[0]["slug"] == "sodium"
             assert json_data[0]["type"] == "mod"
             assert json_data[0]["downloads"] == 50000000
         except json.JSONDecodeError:
             pytest.fail(f"Output is not valid JSON: {result.stdout}")
 
-    def test_search_no_results(self) -> None:
+    def test_search_no_results(self, mock_modrinth: "MagicMock") -> None:
         """Test that search command handles no results gracefully."""
         # Arrange
         mock_result = SearchResult(
@@ -2279,26 +1213,24 @@ class TestSearchCommand:
             limit=10,
         )
 
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(return_value=mock_result)
+        mock_modrinth.search.return_value = mock_result
 
-            # Act
-            result = runner.invoke(app, ["search", "nonexistent-query-xyz"])
+        # Act
+        result = runner.invoke(
+            app, ["search", "nonexistent-query-xyz"], catch_exceptions=False
+        )
 
         # Assert
         assert result.exit_code == 0
         assert "No results" in result.stdout or "0" in result.stdout
 
-    def test_search_api_error(self) -> None:
+    def test_search_api_error(self, mock_modrinth: "MagicMock") -> None:
         """Test that search command handles API errors gracefully."""
         # Arrange
-        with patch("mcpax.cli.app.ModrinthClient") as MockClient:
-            mock_instance = MockClient.return_value.__aenter__.return_value
-            mock_instance.search = AsyncMock(side_effect=APIError("API error"))
+        mock_modrinth.search.side_effect = APIError("API error")
 
-            # Act
-            result = runner.invoke(app, ["search", "test"])
+        # Act
+        result = runner.invoke(app, ["search", "test"])
 
         # Assert
         assert result.exit_code == 1
@@ -2333,598 +1265,169 @@ class TestUpdateCommand:
             or "not initialized" in result.stdout.lower()
         )
 
-    def test_update_check_shows_updates_available(self) -> None:
-        """Test that --check shows available updates."""
-        # Arrange
-        from mcpax.core.models import (
-            InstalledFile,
-            InstallStatus,
-            ProjectConfig,
-            ProjectFile,
-            UpdateCheckResult,
-        )
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
-            ProjectConfig(slug="sodium", project_type=ProjectType.MOD),
-        ]
-
-        mock_results = [
-            UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.OUTDATED,
-                current_version="0.5.0",
-                current_file=InstalledFile(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    filename="sodium-0.5.0.jar",
-                    version_id="old-version-id",
-                    version_number="0.5.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/sodium-0.5.0.jar"),
-                ),
-                latest_version="0.6.0",
-                latest_version_id="version123",
-                latest_file=ProjectFile(
-                    url="https://example.com/sodium-0.6.0.jar",
-                    filename="sodium-0.6.0.jar",
-                    hashes={"sha512": "def456"},
-                    size=1024,
-                    primary=True,
-                ),
-            ),
-        ]
-
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
-            ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
-
-            # Act
-            result = runner.invoke(app, ["update", "--check"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "sodium" in result.stdout
-        assert "0.5.0" in result.stdout
-        assert "0.6.0" in result.stdout
-
-    def test_update_check_shows_not_compatible(self) -> None:
-        """Test that --check shows projects that are not compatible."""
-        # Arrange
-        from mcpax.core.models import InstallStatus, ProjectConfig, UpdateCheckResult
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
-            ProjectConfig(slug="some-mod", project_type=ProjectType.MOD),
-        ]
-
-        mock_results = [
-            UpdateCheckResult(
-                slug="some-mod",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.NOT_COMPATIBLE,
-                current_version=None,
-                current_file=None,
-                latest_version=None,
-                latest_version_id=None,
-                latest_file=None,
-            ),
-        ]
-
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
-            ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
-
-            # Act
-            result = runner.invoke(app, ["update", "--check"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "some-mod" in result.stdout
-        assert "not compatible" in result.stdout.lower()
-
-    def test_update_check_shows_up_to_date(self) -> None:
-        """Test that --check shows projects that are up to date."""
-        # Arrange
-        from mcpax.core.models import (
-            InstalledFile,
-            InstallStatus,
-            ProjectConfig,
-            UpdateCheckResult,
-        )
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
-            ProjectConfig(slug="fabric-api", project_type=ProjectType.MOD),
-        ]
-
-        mock_results = [
-            UpdateCheckResult(
-                slug="fabric-api",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.INSTALLED,
-                current_version="0.92.0",
-                current_file=InstalledFile(
-                    slug="fabric-api",
-                    project_type=ProjectType.MOD,
-                    filename="fabric-api-0.92.0.jar",
-                    version_id="version123",
-                    version_number="0.92.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/fabric-api-0.92.0.jar"),
-                ),
-                latest_version="0.92.0",
-                latest_version_id="version123",
-                latest_file=None,
+    @pytest.mark.parametrize(
+        ("args", "results", "expected"),
+        [
+            pytest.param(
+                ["update", "--check"],
+                ["sodium_outdated"],
+                ["sodium", "0.5.0", "0.6.0"],
+                id="updates-available",
             ),
-        ]
-
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
+            pytest.param(
+                ["update", "--check"],
+                ["some_mod_incompatible"],
+                ["some-mod", "not compatible"],
+                id="not-compatible",
             ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
-
-            # Act
-            result = runner.invoke(app, ["update", "--check"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "fabric-api" in result.stdout
-        assert "up to date" in result.stdout.lower()
-
-    def test_update_check_groups_by_status(self) -> None:
-        """Test that --check groups projects by update status."""
-        # Arrange
-        from mcpax.core.models import (
-            InstalledFile,
-            InstallStatus,
-            ProjectConfig,
-            ProjectFile,
-            UpdateCheckResult,
-        )
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
-            ProjectConfig(slug="sodium", project_type=ProjectType.MOD),
-            ProjectConfig(slug="fabric-api", project_type=ProjectType.MOD),
-            ProjectConfig(slug="some-mod", project_type=ProjectType.MOD),
-        ]
-
-        mock_results = [
-            UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.OUTDATED,
-                current_version="0.5.0",
-                current_file=InstalledFile(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    filename="sodium-0.5.0.jar",
-                    version_id="old-version-id",
-                    version_number="0.5.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/sodium-0.5.0.jar"),
-                ),
-                latest_version="0.6.0",
-                latest_version_id="version123",
-                latest_file=ProjectFile(
-                    url="https://example.com/sodium-0.6.0.jar",
-                    filename="sodium-0.6.0.jar",
-                    hashes={"sha512": "def456"},
-                    size=1024,
-                    primary=True,
-                ),
+            pytest.param(
+                ["update", "--check"],
+                ["fabric_api_installed"],
+                ["fabric-api", "up to date"],
+                id="up-to-date",
             ),
-            UpdateCheckResult(
-                slug="fabric-api",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.INSTALLED,
-                current_version="0.92.0",
-                current_file=InstalledFile(
-                    slug="fabric-api",
-                    project_type=ProjectType.MOD,
-                    filename="fabric-api-0.92.0.jar",
-                    version_id="version123",
-                    version_number="0.92.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/fabric-api-0.92.0.jar"),
-                ),
-                latest_version="0.92.0",
-                latest_version_id="version123",
-                latest_file=None,
+            pytest.param(
+                ["update", "--check"],
+                ["sodium_outdated", "fabric_api_installed", "some_mod_incompatible"],
+                ["sodium", "fabric-api", "some-mod"],
+                id="grouped-by-status",
             ),
-            UpdateCheckResult(
-                slug="some-mod",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.NOT_COMPATIBLE,
-                current_version=None,
-                current_file=None,
-                latest_version=None,
-                latest_version_id=None,
-                latest_file=None,
+            pytest.param(
+                ["update"],
+                ["fabric_api_installed"],
+                ["up to date"],
+                id="no-updates-available",
             ),
+        ],
+    )
+    def test_update_shows_check_results(
+        self,
+        request: pytest.FixtureRequest,
+        mock_load_projects: "MagicMock",
+        mock_manager: "MagicMock",
+        args: list[str],
+        results: list[str],
+        expected: list[str],
+    ) -> None:
+        """Test that update reports each project under its update status."""
+        # Arrange
+        mock_results = [request.getfixturevalue(name) for name in results]
+        mock_load_projects.return_value = [
+            ProjectConfig(slug=r.slug, project_type=r.project_type)
+            for r in mock_results
         ]
+        mock_manager.check_updates = AsyncMock(return_value=mock_results)
 
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
-            ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
-
-            # Act
-            result = runner.invoke(app, ["update", "--check"])
+        # Act
+        result = runner.invoke(app, args, catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        # Should show all three projects grouped by status
-        assert "sodium" in result.stdout
-        assert "fabric-api" in result.stdout
-        assert "some-mod" in result.stdout
+        for text in expected:
+            assert text in result.stdout.lower()
 
-    def test_update_applies_updates_after_confirmation(self) -> None:
+    def test_update_applies_updates_after_confirmation(
+        self,
+        mock_load_projects: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_outdated: "UpdateCheckResult",
+    ) -> None:
         """Test that update applies updates after user confirms."""
         # Arrange
-        from mcpax.core.models import (
-            InstalledFile,
-            InstallStatus,
-            ProjectConfig,
-            ProjectFile,
-            UpdateCheckResult,
-            UpdateResult,
-        )
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
+        mock_load_projects.return_value = [
             ProjectConfig(slug="sodium", project_type=ProjectType.MOD),
         ]
 
         mock_results = [
-            UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.OUTDATED,
-                current_version="0.5.0",
-                current_file=InstalledFile(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    filename="sodium-0.5.0.jar",
-                    version_id="old-version-id",
-                    version_number="0.5.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/sodium-0.5.0.jar"),
-                ),
-                latest_version="0.6.0",
-                latest_version_id="version123",
-                latest_file=ProjectFile(
-                    url="https://example.com/sodium-0.6.0.jar",
-                    filename="sodium-0.6.0.jar",
-                    hashes={"sha512": "def456"},
-                    size=1024,
-                    primary=True,
-                ),
-            ),
+            sodium_outdated,
         ]
 
         mock_update_result = UpdateResult(
             successful=["sodium"], failed=[], backed_up=[]
         )
 
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
+        mock_manager.check_updates = AsyncMock(return_value=mock_results)
+        mock_manager.apply_updates = AsyncMock(return_value=mock_update_result)
 
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
-            ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-            patch("mcpax.cli.app.typer.confirm", return_value=True),
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
-            mock_instance.apply_updates = AsyncMock(return_value=mock_update_result)
-
-            # Act
-            result = runner.invoke(app, ["update"])
+        # Act
+        result = runner.invoke(app, ["update"], input="y\n", catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
+        assert "Apply updates?" in result.stdout
         assert "sodium" in result.stdout
-        mock_instance.apply_updates.assert_called_once()
+        mock_manager.apply_updates.assert_called_once()
 
-    def test_update_cancels_on_no(self) -> None:
+    def test_update_cancels_on_no(
+        self,
+        mock_load_projects: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_outdated: "UpdateCheckResult",
+    ) -> None:
         """Test that update cancels when user declines."""
         # Arrange
-        from mcpax.core.models import (
-            InstalledFile,
-            InstallStatus,
-            ProjectConfig,
-            ProjectFile,
-            UpdateCheckResult,
-        )
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
+        mock_load_projects.return_value = [
             ProjectConfig(slug="sodium", project_type=ProjectType.MOD),
         ]
 
         mock_results = [
-            UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.OUTDATED,
-                current_version="0.5.0",
-                current_file=InstalledFile(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    filename="sodium-0.5.0.jar",
-                    version_id="old-version-id",
-                    version_number="0.5.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/sodium-0.5.0.jar"),
-                ),
-                latest_version="0.6.0",
-                latest_version_id="version123",
-                latest_file=ProjectFile(
-                    url="https://example.com/sodium-0.6.0.jar",
-                    filename="sodium-0.6.0.jar",
-                    hashes={"sha512": "def456"},
-                    size=1024,
-                    primary=True,
-                ),
-            ),
+            sodium_outdated,
         ]
 
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
-            ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-            patch("mcpax.cli.app.typer.confirm", return_value=False),
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
-            mock_instance.apply_updates = AsyncMock(return_value=[])
+        mock_manager.check_updates = AsyncMock(return_value=mock_results)
+        mock_manager.apply_updates = AsyncMock(return_value=[])
 
-            # Act
-            result = runner.invoke(app, ["update"])
+        # Act
+        result = runner.invoke(app, ["update"], input="n\n", catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        mock_instance.apply_updates.assert_not_called()
+        mock_manager.apply_updates.assert_not_called()
 
-    def test_update_yes_skips_confirmation(self) -> None:
+    def test_update_yes_skips_confirmation(
+        self,
+        mock_load_projects: "MagicMock",
+        mock_manager: "MagicMock",
+        sodium_outdated: "UpdateCheckResult",
+    ) -> None:
         """Test that --yes skips confirmation prompt."""
         # Arrange
-        from mcpax.core.models import (
-            InstalledFile,
-            InstallStatus,
-            ProjectConfig,
-            ProjectFile,
-            UpdateCheckResult,
-            UpdateResult,
-        )
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
+        mock_load_projects.return_value = [
             ProjectConfig(slug="sodium", project_type=ProjectType.MOD),
         ]
 
         mock_results = [
-            UpdateCheckResult(
-                slug="sodium",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.OUTDATED,
-                current_version="0.5.0",
-                current_file=InstalledFile(
-                    slug="sodium",
-                    project_type=ProjectType.MOD,
-                    filename="sodium-0.5.0.jar",
-                    version_id="old-version-id",
-                    version_number="0.5.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/sodium-0.5.0.jar"),
-                ),
-                latest_version="0.6.0",
-                latest_version_id="version123",
-                latest_file=ProjectFile(
-                    url="https://example.com/sodium-0.6.0.jar",
-                    filename="sodium-0.6.0.jar",
-                    hashes={"sha512": "def456"},
-                    size=1024,
-                    primary=True,
-                ),
-            ),
+            sodium_outdated,
         ]
 
         mock_update_result = UpdateResult(
             successful=["sodium"], failed=[], backed_up=[]
         )
 
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
-            ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-            patch("mcpax.cli.app.typer.confirm") as mock_confirm,
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
-            mock_instance.apply_updates = AsyncMock(return_value=mock_update_result)
-
-            # Act
-            result = runner.invoke(app, ["update", "--yes"])
-
-        # Assert
-        assert result.exit_code == 0
-        mock_confirm.assert_not_called()
-        mock_instance.apply_updates.assert_called_once()
-
-    def test_update_no_updates_available(self) -> None:
-        """Test that update shows message when all projects are up to date."""
-        # Arrange
-        from mcpax.core.models import (
-            InstalledFile,
-            InstallStatus,
-            ProjectConfig,
-            UpdateCheckResult,
-        )
-
-        mock_config = {
-            "minecraft": {"version": "1.21.4", "mod_loader": "fabric"},
-            "paths": {"minecraft_dir": "~/.minecraft"},
-        }
-
-        mock_projects = [
-            ProjectConfig(slug="fabric-api", project_type=ProjectType.MOD),
-        ]
-
-        mock_results = [
-            UpdateCheckResult(
-                slug="fabric-api",
-                project_type=ProjectType.MOD,
-                status=InstallStatus.INSTALLED,
-                current_version="0.92.0",
-                current_file=InstalledFile(
-                    slug="fabric-api",
-                    project_type=ProjectType.MOD,
-                    filename="fabric-api-0.92.0.jar",
-                    version_id="version123",
-                    version_number="0.92.0",
-                    sha512="abc123",
-                    installed_at=datetime(2024, 1, 1, tzinfo=UTC),
-                    file_path=Path("~/.minecraft/mods/fabric-api-0.92.0.jar"),
-                ),
-                latest_version="0.92.0",
-                latest_version_id="version123",
-                latest_file=None,
-            ),
-        ]
-
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        with (
-            patch(
-                "mcpax.cli.app.get_default_config_path", return_value=mock_config_path
-            ),
-            patch("mcpax.cli.app.load_config", return_value=mock_config),
-            patch("mcpax.cli.app.load_projects", return_value=mock_projects),
-            patch("mcpax.cli.app.ProjectManager") as MockManager,
-        ):
-            mock_instance = MockManager.return_value.__aenter__.return_value
-            mock_instance.check_updates = AsyncMock(return_value=mock_results)
+        mock_manager.check_updates = AsyncMock(return_value=mock_results)
+        mock_manager.apply_updates = AsyncMock(return_value=mock_update_result)
 
-            # Act
-            result = runner.invoke(app, ["update"])
+        # Act
+        result = runner.invoke(app, ["update", "--yes"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        assert (
-            "up to date" in result.stdout.lower()
-            or "no updates" in result.stdout.lower()
-        )
+        assert "Apply updates?" not in result.stdout  # No confirmation prompt
+        mock_manager.apply_updates.assert_called_once()
 
 
 class TestConfigPathCommand:
     """Tests for config path command."""
 
-    def test_config_path_shows_default_path(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_path_shows_default_path(self, tmp_path: Path) -> None:
         """Test that config path shows the config file path."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
         config_file = tmp_path / "mcpax" / "config.toml"
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text("")
 
         # Act
-        result = runner.invoke(app, ["config", "path"])
+        result = runner.invoke(app, ["config", "path"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
@@ -2942,7 +1445,7 @@ class TestConfigPathCommand:
         config_file.write_text("")
 
         # Act
-        result = runner.invoke(app, ["config", "path"])
+        result = runner.invoke(app, ["config", "path"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
@@ -2953,114 +1456,38 @@ class TestConfigPathCommand:
 class TestConfigGetCommand:
     """Tests for config get command."""
 
-    def test_config_get_valid_key(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that config get retrieves a valid key value."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 5
-verify_hash = true
-"""
-        )
-
-        # Act
-        result = runner.invoke(app, ["config", "get", "minecraft.version"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "1.21.4" in result.stdout
-
-    def test_config_get_integer_value(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that config get retrieves integer value."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 10
-verify_hash = true
-"""
-        )
-
-        # Act
-        result = runner.invoke(app, ["config", "get", "download.max_concurrent"])
-
-        # Assert
-        assert result.exit_code == 0
-        assert "10" in result.stdout
-
-    def test_config_get_boolean_value(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that config get retrieves boolean value."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 5
-verify_hash = false
-"""
-        )
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            pytest.param("minecraft.version", "1.21.4", id="string"),
+            pytest.param("download.max_concurrent", "10", id="integer"),
+            pytest.param("download.verify_hash", "False", id="boolean"),
+        ],
+    )
+    def test_config_get_value(
+        self,
+        readonly_config_home: Path,
+        monkeypatch: "pytest.MonkeyPatch",
+        key: str,
+        expected: str,
+    ) -> None:
+        """Test that config get prints the value stored under a key."""
+        # Arrange
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(readonly_config_home))
 
         # Act
-        result = runner.invoke(app, ["config", "get", "download.verify_hash"])
+        result = runner.invoke(app, ["config", "get", key], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
-        assert "false" in result.stdout.lower()
+        assert result.stdout == f"{expected}\n"
 
     def test_config_get_invalid_key(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, readonly_config_home: Path, monkeypatch: "pytest.MonkeyPatch"
     ) -> None:
         """Test that config get shows error for invalid key."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-"""
-        )
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(readonly_config_home))
 
         # Act
         result = runner.invoke(app, ["config", "get", "invalid.key"])
@@ -3069,13 +1496,8 @@ minecraft_dir = "~/.minecraft"
         assert result.exit_code == 1
         assert "Unknown config key" in result.stdout or "Error" in result.stdout
 
-    def test_config_get_config_not_found(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_get_config_not_found(self) -> None:
         """Test that config get shows error when config.toml not found."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
         # Act
         result = runner.invoke(app, ["config", "get", "minecraft.version"])
 
@@ -3088,30 +1510,14 @@ class TestConfigListCommand:
     """Tests for config list command."""
 
     def test_config_list_shows_all_settings(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, readonly_config_home: Path, monkeypatch: "pytest.MonkeyPatch"
     ) -> None:
         """Test that config list shows all settings."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 5
-verify_hash = true
-"""
-        )
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(readonly_config_home))
 
         # Act
-        result = runner.invoke(app, ["config", "list"])
+        result = runner.invoke(app, ["config", "list"], catch_exceptions=False)
 
         # Assert
         assert result.exit_code == 0
@@ -3122,30 +1528,16 @@ verify_hash = true
         assert "download" in result.stdout.lower()
 
     def test_config_list_json_output(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, readonly_config_home: Path, monkeypatch: "pytest.MonkeyPatch"
     ) -> None:
         """Test that config list --json outputs JSON format."""
         # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 5
-verify_hash = true
-"""
-        )
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(readonly_config_home))
 
         # Act
-        result = runner.invoke(app, ["config", "list", "--json"])
+        result = runner.invoke(
+            app, ["config", "list", "--json"], catch_exceptions=False
+        )
 
         # Assert
         assert result.exit_code == 0
@@ -3158,119 +1550,34 @@ verify_hash = true
 class TestConfigSetCommand:
     """Tests for config set command."""
 
-    def test_config_set_string_value(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that config set updates string value."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 5
-verify_hash = true
-"""
-        )
-
-        # Act
-        result = runner.invoke(app, ["config", "set", "minecraft.version", "1.21.5"])
-
-        # Assert
-        assert result.exit_code == 0
-        # Verify the value was actually updated
-        verify_result = runner.invoke(app, ["config", "get", "minecraft.version"])
-        assert "1.21.5" in verify_result.stdout
-
-    def test_config_set_integer_value(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that config set updates integer value."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 5
-verify_hash = true
-"""
-        )
-
+    @pytest.mark.parametrize(
+        ("key", "value", "expected"),
+        [
+            pytest.param("minecraft.version", "1.21.5", "1.21.5", id="string"),
+            pytest.param("download.max_concurrent", "10", 10, id="integer"),
+            pytest.param("download.verify_hash", "false", False, id="boolean"),
+        ],
+    )
+    def test_config_set_value(
+        self, initialized_config: Path, key: str, value: str, expected: object
+    ) -> None:
+        """Test that config set stores the value with the key's type."""
         # Act
-        result = runner.invoke(app, ["config", "set", "download.max_concurrent", "10"])
-
-        # Assert
-        assert result.exit_code == 0
-        verify_result = runner.invoke(app, ["config", "get", "download.max_concurrent"])
-        assert "10" in verify_result.stdout
-
-    def test_config_set_boolean_value(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that config set updates boolean value."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-
-[download]
-max_concurrent = 5
-verify_hash = true
-"""
+        result = runner.invoke(
+            app, ["config", "set", key, value], catch_exceptions=False
         )
 
-        # Act
-        result = runner.invoke(app, ["config", "set", "download.verify_hash", "false"])
-
         # Assert
         assert result.exit_code == 0
-        verify_result = runner.invoke(app, ["config", "get", "download.verify_hash"])
-        assert "false" in verify_result.stdout.lower()
+        # Verify the value was actually updated
+        config = tomllib.loads((initialized_config / "config.toml").read_text())
+        section, field = key.split(".")
+        stored = config[section][field]
+        assert stored == expected
+        assert type(stored) is type(expected)
 
-    def test_config_set_invalid_key(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_set_invalid_key(self, initialized_config: Path) -> None:
         """Test that config set shows error for invalid key."""
-        # Arrange
-        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-        config_file = tmp_path / "mcpax" / "config.toml"
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(
-            """
-[minecraft]
-version = "1.21.4"
-mod_loader = "fabric"
-
-[paths]
-minecraft_dir = "~/.minecraft"
-"""
-        )
-
         # Act
         result = runner.invoke(app, ["config", "set", "invalid.key", "value"])
 